@@ -1,7 +1,96 @@
+import asyncio
+import csv
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import cached_property
+from typing import Optional
+
+import aiohttp
+import diskcache
+import numpy as np
 import requests
-from bs4 import BeautifulSoup
-from sentence_transformers import SentenceTransformer, util
-from transformers import pipeline
+import torch
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from sentence_transformers import SentenceTransformer
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+from page_text import charset_from_content_type, extract_text
+
+SIMILARITY_MODEL = "sentence-transformers/all-mpnet-base-v2"
+SENTIMENT_MODEL = "cardiffnlp/twitter-roberta-base-sentiment"
+SENTIMENT_MAX_TOKENS = 128  # Leading tokens of a page the sentiment model sees
+BIAS_SCORES = (30, 50, 100)  # Indexed by sentiment class: negative, neutral, positive
+STAR_ICONS = tuple("⭐" * stars for stars in range(6))  # Indexed by star count
+
+HEADERS = {"User-Agent": "Mozilla/5.0"}  # Helps bypass some bot protections
+FETCH_TIMEOUT = 10  # Seconds
+MEMORY_CACHE_SIZE = 4096  # Embeddings kept when no cache directory is given
+
+
+def _usable_cpu_count() -> int:
+    """ CPUs this process may actually run on, honouring affinity masks where exposed. """
+    if hasattr(os, "process_cpu_count"):  # Python 3.13+
+        return os.process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class _LRUCache(OrderedDict):
+    """ In-memory embedding cache that evicts the least recently used entry past maxsize. """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class FetchStatus(IntEnum):
+    """ Why a page fetch succeeded or failed. """
+    OK = 0
+    TIMEOUT = 1
+    HTTP = 2
+    OTHER = 3
+    NO_CONTENT = 4
+
+
+@dataclass(slots=True)
+class FetchResult:
+    """ Outcome of fetching a page: its text when ok, otherwise an error message. """
+    status: FetchStatus
+    text: str = ""
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.status == FetchStatus.OK
+
+
+def _page_result(content: str) -> FetchResult:
+    """ Wraps extracted page text, treating an empty page as a failed fetch. """
+    if not content:
+        return FetchResult(FetchStatus.NO_CONTENT, error="Error: No readable content found on the page.")
+    return FetchResult(FetchStatus.OK, text=content)
+
 
 class URLValidator:
     """
@@ -9,61 +98,334 @@ class URLValidator:
     using domain trust, content relevance, fact-checking, bias detection, and citations.
     """
 
-    def __init__(self):
-        # Load models once to avoid redundant API calls
-        self.similarity_model = SentenceTransformer('sentence-transformers/all-mpnet-base-v2')
-        self.fake_news_classifier = pipeline("text-classification", model="mrm8488/bert-tiny-finetuned-fake-news-detection")
-        self.sentiment_analyzer = pipeline("text-classification", model="cardiffnlp/twitter-roberta-base-sentiment")
+    def __init__(self, backend: str = "torch", quantize: bool = False, cache_dir: str = ".emb_cache",
+                 onnx_dir: str = ".onnx_models"):
+        """
+        backend selects the inference runtime: "torch" (default) or "onnx", which
+        runs the similarity and sentiment models through ONNX Runtime and
+        requires optimum[onnxruntime] (experimental: model loading and export
+        have not been exercised against the hub models). quantize applies INT8 dynamic quantization
+        to the linear layers of the torch models. cache_dir is where embeddings
+        are persisted between runs; pass None to keep them in memory only.
+        onnx_dir is where the ONNX backend keeps the models it exports.
+        """
+        if backend not in ("torch", "onnx"):
+            raise ValueError(f"Unknown backend: {backend!r}")
+        if quantize and backend != "torch":
+            raise ValueError("quantize is only supported with the torch backend")
+        self.backend = backend
+        self.quantize = quantize
+        self.onnx_dir = onnx_dir
+        # Use every available core for intra-op parallelism in the torch kernels;
+        # os.cpu_count() would report the host's cores inside a restricted container
+        torch.set_num_threads(_usable_cpu_count())
+        # Reuse pooled keep-alive connections across fetches
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        # Retry connection failures only; a retried read timeout would surface as a
+        # ConnectionError and multiply the time spent on a hung host
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                              max_retries=Retry(total=2, read=False, backoff_factor=0.2))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Embeddings keyed by the model variant and a SHA-1 digest of the text
+        # they were computed from; bounded in memory when there is no cache directory
+        if cache_dir:
+            self._emb_cache = diskcache.Cache(cache_dir, size_limit=2 << 30)
+        else:
+            self._emb_cache = _LRUCache(MEMORY_CACHE_SIZE)
+        self._model_tag = f"{SIMILARITY_MODEL}:{backend}{':int8' if quantize else ''}"
+        # Created on the fetch loop by the first fetch_many/afetch_many call
+        self._client_session = None
+
+    # Models are loaded on first use and then kept, so constructing a validator
+    # (e.g. just to fetch pages) does not pull in the model weights.
+
+    @cached_property
+    def similarity_model(self) -> SentenceTransformer:
+        """ Sentence-transformer used for query/content relevance. """
+        if self.backend == "onnx":
+            export_dir = self._onnx_export_dir(SIMILARITY_MODEL)
+            if os.path.isdir(export_dir):
+                model = SentenceTransformer(export_dir, backend="onnx", model_kwargs=self._ort_kwargs())
+            else:
+                model = SentenceTransformer(SIMILARITY_MODEL, backend="onnx", model_kwargs=self._ort_kwargs())
+                self._save_onnx_export(model, export_dir)
+        else:
+            model = SentenceTransformer(SIMILARITY_MODEL)
+            if self.quantize:
+                transformer = model[0]
+                transformer.auto_model = self._quantize(transformer.auto_model)
+        return model.eval()
+
+    @cached_property
+    def sent_model(self):
+        """ Sentiment classifier used for bias detection. """
+        if self.backend == "onnx":
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+
+            export_dir = self._onnx_export_dir(SENTIMENT_MODEL)
+            if os.path.isdir(export_dir):
+                return ORTModelForSequenceClassification.from_pretrained(export_dir, **self._ort_kwargs())
+            # Only the first run pays for the torch -> ONNX export; later runs load the saved copy
+            model = ORTModelForSequenceClassification.from_pretrained(SENTIMENT_MODEL, export=True, **self._ort_kwargs())
+            self._save_onnx_export(model, export_dir)
+            return model
+        model = AutoModelForSequenceClassification.from_pretrained(SENTIMENT_MODEL).eval()
+        return self._quantize(model) if self.quantize else model
+
+    @cached_property
+    def sent_tokenizer(self):
+        """ Fast tokenizer matching sent_model. """
+        return AutoTokenizer.from_pretrained(SENTIMENT_MODEL, use_fast=True)
+
+    @cached_property
+    def parse_pool(self) -> ThreadPoolExecutor:
+        """
+        Threads that parse HTML for fetch_many, off the fetch loop. lxml releases
+        the GIL while libxml2 parses, so pages parse in parallel.
+        """
+        return ThreadPoolExecutor(max_workers=min(8, _usable_cpu_count()), thread_name_prefix="URLValidator-parse")
+
+    @cached_property
+    def _fetch_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Event loop on a daemon thread that runs every async fetch. Owning the
+        loop lets the aiohttp session (and its pooled connections) outlive a
+        single call, and keeps fetch_many usable from code that already runs
+        an event loop.
+        """
+        loop = asyncio.new_event_loop()
+        self._fetch_thread = threading.Thread(target=loop.run_forever, name="URLValidator-fetch", daemon=True)
+        self._fetch_thread.start()
+        return loop
+
+    def close(self):
+        """ Shuts down the fetch loop and parse threads and releases the HTTP sessions and embedding cache. """
+        loop = self.__dict__.pop("_fetch_loop", None)
+        if loop is not None:
+            if self._client_session is not None:
+                asyncio.run_coroutine_threadsafe(self._client_session.close(), loop).result()
+                self._client_session = None
+            loop.call_soon_threadsafe(loop.stop)
+            self._fetch_thread.join()
+            loop.close()
+        parse_pool = self.__dict__.pop("parse_pool", None)
+        if parse_pool is not None:
+            parse_pool.shutdown()
+        self.session.close()
+        if isinstance(self._emb_cache, diskcache.Cache):
+            self._emb_cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _quantize(model: torch.nn.Module) -> torch.nn.Module:
+        """ Swaps the Linear layers of a torch model for INT8 dynamic-quantized ones. """
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    def _onnx_export_dir(self, model_name: str) -> str:
+        """ Directory holding the saved ONNX export of a hub model. """
+        return os.path.join(self.onnx_dir, model_name.replace("/", "--"))
+
+    @staticmethod
+    def _save_onnx_export(model, export_dir: str):
+        """
+        Saves an exported model, swapping it into place only once it is complete.
+        If another process got there first, its copy is kept and this one is
+        discarded; the caller's in-memory model is the same export either way.
+        """
+        parent = os.path.dirname(export_dir)
+        os.makedirs(parent, exist_ok=True)
+        # A private temporary directory, so concurrent exports never write into each other's
+        tmp_dir = tempfile.mkdtemp(prefix=os.path.basename(export_dir) + ".", suffix=".tmp", dir=parent)
+        try:
+            model.save_pretrained(tmp_dir)
+            os.replace(tmp_dir, export_dir)
+        except OSError:
+            if not os.path.isdir(export_dir):
+                raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
 
-    def fetch_page_content(self, url: str) -> str:
+    @staticmethod
+    def _ort_kwargs() -> dict:
+        """ ONNX Runtime options shared by the ONNX models. """
+        import onnxruntime as ort
+
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session_options.intra_op_num_threads = _usable_cpu_count()
+        return {"provider": "CPUExecutionProvider", "session_options": session_options}
+
+    def fetch_page_content(self, url: str) -> FetchResult:
         """ Fetches and extracts text content from the given URL. """
         try:
-            headers = {"User-Agent": "Mozilla/5.0"}  # Helps bypass some bot protections
-            response = requests.get(url, timeout=10, headers=headers)
+            response = self.session.get(url, timeout=FETCH_TIMEOUT)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            content = " ".join([p.text for p in soup.find_all("p")])
-            return content if content else "Error: No readable content found on the page."
         except requests.exceptions.Timeout:
-            return "Error: Request timed out."
+            return FetchResult(FetchStatus.TIMEOUT, error="Error: Request timed out.")
         except requests.exceptions.HTTPError as e:
-            return f"Error: HTTP {e.response.status_code} - Page may not exist."
+            return FetchResult(FetchStatus.HTTP, error=f"Error: HTTP {e.response.status_code} - Page may not exist.")
         except requests.exceptions.RequestException as e:
-            return f"Error: Unable to fetch URL ({str(e)})."
+            return FetchResult(FetchStatus.OTHER, error=f"Error: Unable to fetch URL ({str(e)}).")
+        charset = charset_from_content_type(response.headers.get("Content-Type", ""))
+        try:
+            return _page_result(extract_text(response.content, charset))
+        except Exception as e:
+            return FetchResult(FetchStatus.OTHER, error=f"Error: Unable to parse page ({e!r}).")
+
+    def fetch_many(self, urls: list) -> list:
+        """
+        Fetches several URLs concurrently; results are in the same order as urls.
+        Each distinct URL is fetched only once. The fetches run on the
+        validator's own event loop, so this also works when the caller is
+        inside a running loop (e.g. Jupyter), though it blocks until done;
+        async code should await afetch_many instead.
+        """
+        return asyncio.run_coroutine_threadsafe(self._fetch_unique(urls), self._fetch_loop).result()
+
+    async def afetch_many(self, urls: list) -> list:
+        """ Async variant of fetch_many; awaits the fetches without blocking the caller's loop. """
+        future = asyncio.run_coroutine_threadsafe(self._fetch_unique(urls), self._fetch_loop)
+        return await asyncio.wrap_future(future)
+
+    async def _fetch_unique(self, urls: list) -> list:
+        """ Fetches each distinct URL once, concurrently, over the shared client session. """
+        if self._client_session is None:
+            self._client_session = aiohttp.ClientSession(
+                # Per-socket limits, like requests' timeout: a total budget would
+                # also run while a request waits for a free connector slot
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=FETCH_TIMEOUT, sock_read=FETCH_TIMEOUT),
+                headers=HEADERS,
+                connector=aiohttp.TCPConnector(limit=16)
+            )
+        unique_urls = list(dict.fromkeys(urls))
+        fetched = await asyncio.gather(*(self._afetch(url) for url in unique_urls))
+        results = dict(zip(unique_urls, fetched))
+        return [results[url] for url in urls]
+
+    async def _afetch(self, url: str) -> FetchResult:
+        """ Asynchronously fetches and extracts text content from the given URL. """
+        try:
+            async with self._client_session.get(url) as response:
+                response.raise_for_status()
+                html = await response.read()
+                charset = response.charset
+        except asyncio.TimeoutError:
+            return FetchResult(FetchStatus.TIMEOUT, error="Error: Request timed out.")
+        except aiohttp.ClientResponseError as e:
+            return FetchResult(FetchStatus.HTTP, error=f"Error: HTTP {e.status} - Page may not exist.")
+        except aiohttp.ClientError as e:
+            return FetchResult(FetchStatus.OTHER, error=f"Error: Unable to fetch URL ({str(e)}).")
+        try:
+            return _page_result(await self._parse_page(html, charset))
+        except Exception as e:  # One unparsable page must not fail the whole batch
+            return FetchResult(FetchStatus.OTHER, error=f"Error: Unable to parse page ({e!r}).")
+
+    async def _parse_page(self, html: bytes, charset: Optional[str]) -> str:
+        """
+        Parses a page in the parse pool so other fetches progress while it runs.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.parse_pool, extract_text, html, charset)
 
     def get_domain_trust(self, url: str, content: str) -> int:
         """ Simulated function to assess domain trust. """
-        if "Error" in content:
-            return 0
         return len(url) % 5 + 1  # Mock trust rating (1-5)
 
     def compute_similarity_score(self, user_query: str, content: str) -> int:
         """ Computes semantic similarity between user query and page content. """
-        if "Error" in content:
-            return 0
-        return int(util.pytorch_cos_sim(
-            self.similarity_model.encode(user_query),
-            self.similarity_model.encode(content)
-        ).item() * 100)
+        query_emb, content_emb = self._encode_cached(
+            [user_query, content],
+            [self._query_key(user_query), self._content_key(content)]
+        )
+        # Accumulate the float16 dot product in float32
+        return int(float(np.einsum("i,i->", query_emb, content_emb, dtype=np.float32)) * 100)
+
+    def _query_key(self, user_query: str) -> tuple:
+        """ Cache key for a query; case and surrounding whitespace are ignored. """
+        return (self._model_tag, "query", hashlib.sha1(user_query.strip().lower().encode()).digest())
+
+    def _content_key(self, content: str) -> tuple:
+        """ Cache key for page content. """
+        return (self._model_tag, "content", hashlib.sha1(content.encode()).digest())
+
+    def _encode_cached(self, texts: list, keys: list) -> list:
+        """ Returns normalized float16 embeddings for texts, encoding only those not cached yet. """
+        # One cache lookup per key; hits and fresh encodings are returned from
+        # here, so nothing depends on an entry surviving eviction in between
+        found, missing = {}, {}
+        for text, key in zip(texts, keys):
+            if key in found or key in missing:
+                continue
+            emb = self._emb_cache.get(key)
+            if emb is None:
+                missing[key] = text
+            else:
+                found[key] = emb
+        if missing:
+            # Encode all cache misses in batched forward passes. encode() sorts
+            # the texts by length so each batch pads only to its own longest
+            # text. Normalized embeddings make cosine similarity a plain dot product.
+            with torch.inference_mode():
+                embs = self.similarity_model.encode(
+                    list(missing.values()),
+                    batch_size=32,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    show_progress_bar=False
+                )
+            for key, emb in zip(missing, embs):
+                # Stored as float16 to halve the cache size in memory and on disk
+                found[key] = self._emb_cache[key] = emb.astype(np.float16)
+        return [found[key] for key in keys]
 
     def check_facts(self, content: str) -> int:
         """ Simulated function to check fact reliability. """
-        if "Error" in content:
-            return 0
         return len(content) % 5 + 1  # Mock fact-check rating (1-5)
 
     def detect_bias(self, content: str) -> int:
         """ Uses NLP sentiment analysis to detect potential bias in content. """
-        if "Error" in content:
-            return 0
-        sentiment_result = self.sentiment_analyzer(content[:512])[0]
-        return 100 if sentiment_result["label"] == "POSITIVE" else 50 if sentiment_result["label"] == "NEUTRAL" else 30
+        return self._classify_sentiment(self._tokenize_for_sentiment([content]))[0]
+
+    def detect_bias_batch(self, contents: list) -> list:
+        """ Runs bias detection over several contents in batched forward passes. """
+        if not contents:
+            return []
+        input_ids = self._tokenize_for_sentiment(contents)
+        # Run similar-length texts together so each batch pads to a short maximum
+        order = sorted(range(len(input_ids)), key=lambda i: len(input_ids[i]))
+
+        bias_scores = [0] * len(input_ids)
+        for start in range(0, len(order), 16):
+            batch = order[start:start + 16]
+            for i, score in zip(batch, self._classify_sentiment([input_ids[i] for i in batch])):
+                bias_scores[i] = score
+        return bias_scores
+
+    def _tokenize_for_sentiment(self, contents: list) -> list:
+        """ Tokenizes the leading SENTIMENT_MAX_TOKENS tokens of each content, unpadded. """
+        # English averages ~4 characters per token, so 8 per token leaves ample headroom
+        # while sparing the tokenizer from walking whole pages only to truncate them
+        texts = [content[:SENTIMENT_MAX_TOKENS * 8] for content in contents]
+        return self.sent_tokenizer(texts, truncation=True, max_length=SENTIMENT_MAX_TOKENS)["input_ids"]
+
+    def _classify_sentiment(self, input_ids: list) -> list:
+        """ Runs one padded batch through the sentiment model and maps each class to a bias score. """
+        inputs = self.sent_tokenizer.pad({"input_ids": input_ids}, return_tensors="pt")
+        with torch.inference_mode():
+            logits = self.sent_model(**inputs).logits
+        return [BIAS_SCORES[label] for label in logits.argmax(-1).tolist()]
 
     def get_star_rating(self, score: float) -> tuple:
         """ Converts a score (0-100) into a 1-5 star rating. """
         stars = max(1, min(5, round(score / 20)))  # Normalize 100-scale to 5-star scale
-        return stars, "⭐" * stars
+        return stars, STAR_ICONS[stars]
 
     def generate_explanation(self, domain_trust, similarity_score, fact_check_score, bias_score, final_score) -> str:
         """ Generates a human-readable explanation for the score. """
@@ -79,18 +441,61 @@ class URLValidator:
 
         return " ".join(reasons) if reasons else "This source is highly credible and relevant."
 
-    def rate_url_validity(self, user_query: str, url: str):
-        """ Main function to evaluate the validity of a webpage. """
-        content = self.fetch_page_content(url)
+    def rate_url_validity(self, user_query: str, url: str, fetched: Optional[FetchResult] = None):
+        """
+        Main function to evaluate the validity of a webpage. Pass the page's
+        FetchResult as fetched (e.g. from fetch_many) to skip fetching it again.
+        """
+        result = fetched if fetched is not None else self.fetch_page_content(url)
 
         # Handle errors
-        if "Error" in content:
-            return {"Validation Error": content}
+        if not result.ok:
+            return {"Validation Error": result.error}
 
-        domain_trust = self.get_domain_trust(url, content)
+        content = result.text
         similarity_score = self.compute_similarity_score(user_query, content)
-        fact_check_score = self.check_facts(content)
         bias_score = self.detect_bias(content)
+        return self._build_report(url, content, similarity_score, bias_score)
+
+    def rate_urls(self, user_queries: list, urls: list) -> list:
+        """
+        Evaluates many (query, url) pairs at once. Pages are fetched concurrently
+        and the models run over all of them in batches instead of one page at a time.
+        """
+        results = self.fetch_many(urls)
+        fetched = [i for i, result in enumerate(results) if result.ok]
+        fetched_contents = [results[i].text for i in fetched]
+
+        # Embed every query and fetched page in one batched call (repeats are
+        # encoded once), then score all pairs with a single row-wise dot product.
+        fetched_queries = [user_queries[i] for i in fetched]
+        embs = self._encode_cached(
+            fetched_queries + fetched_contents,
+            [self._query_key(q) for q in fetched_queries] + [self._content_key(c) for c in fetched_contents]
+        )
+        similarity_scores = {}
+        if fetched:
+            query_embs = np.stack(embs[:len(fetched)])
+            content_embs = np.stack(embs[len(fetched):])
+            sims = np.einsum("ij,ij->i", query_embs, content_embs, dtype=np.float32)
+            similarity_scores = {i: int(float(sim) * 100) for i, sim in zip(fetched, sims)}
+        # A page repeated across queries only goes through the sentiment model once
+        unique_contents = list(dict.fromkeys(fetched_contents))
+        content_bias = dict(zip(unique_contents, self.detect_bias_batch(unique_contents)))
+        bias_scores = {i: content_bias[results[i].text] for i in fetched}
+
+        reports = []
+        for i, (url, result) in enumerate(zip(urls, results)):
+            if not result.ok:
+                reports.append({"Validation Error": result.error})
+                continue
+            reports.append(self._build_report(url, result.text, similarity_scores[i], bias_scores[i]))
+        return reports
+
+    def _build_report(self, url: str, content: str, similarity_score: int, bias_score: int) -> dict:
+        """ Combines the individual scores into the validity report. """
+        domain_trust = self.get_domain_trust(url, content)
+        fact_check_score = self.check_facts(content)
 
         final_score = (
             (0.3 * domain_trust) +
@@ -111,7 +516,24 @@ class URLValidator:
                 "Final Validity Score": final_score
             },
             "stars": {
+                "score": stars,
                 "icon": icon
             },
             "explanation": explanation
         }
+
+
+def write_ratings_csv(validator: URLValidator, user_queries: list, urls: list, csv_filename: str = "ratings.csv"):
+    """
+    Rates each (query, url) pair and streams the star ratings to a CSV file.
+    Pages that could not be validated get a rating of 0. The columns match the
+    committed Deliverable.csv, which the default path leaves untouched.
+    """
+    reports = validator.rate_urls(user_queries, urls)
+    with open(csv_filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["user_prompt", "url_to_check", "func_rating", "custom_rating"])
+        for user_query, url, report in zip(user_queries, urls, reports):
+            func_rating = report["stars"]["score"] if "stars" in report else 0
+            custom_rating = func_rating + 1 if 0 < func_rating < 5 else func_rating
+            writer.writerow([user_query, url, func_rating, custom_rating])
@@ -0,0 +1,51 @@
+"""
+HTML text extraction for URLValidator, kept free of ML imports so it can be
+used and tested without loading torch.
+"""
+import codecs
+from email.message import Message
+from typing import Optional
+
+import lxml.etree
+import lxml.html
+
+
+def charset_from_content_type(content_type: str) -> Optional[str]:
+    """ Returns the charset declared in a Content-Type header, if any. """
+    message = Message()
+    message["content-type"] = content_type
+    return message.get_content_charset()
+
+
+def _html_parser(charset: Optional[str]) -> lxml.html.HTMLParser:
+    """
+    Builds an HTML parser for the declared charset. libxml2 knows fewer names
+    than Python (e.g. it rejects "latin_1"), so Python's canonical name for the
+    codec is tried next, and lxml's own detection is the last resort.
+    """
+    candidates = [charset]
+    try:
+        candidates.append(codecs.lookup(charset).name)
+    except (LookupError, TypeError):  # Unknown to Python too, or no charset
+        pass
+    for encoding in candidates:
+        if encoding:
+            try:
+                return lxml.html.HTMLParser(encoding=encoding)
+            except LookupError:
+                continue
+    return lxml.html.HTMLParser()
+
+
+def extract_text(html: bytes, charset: Optional[str] = None) -> str:
+    """
+    Extracts the text of all paragraphs from an HTML document. charset is the
+    encoding declared by the HTTP headers; without one lxml detects it from the
+    document itself (BOM or <meta charset>).
+    """
+    try:
+        tree = lxml.html.fromstring(html, parser=_html_parser(charset))
+    except lxml.etree.ParserError:  # Empty or non-HTML body
+        return ""
+    lxml.etree.strip_elements(tree, "script", "style", with_tail=False)
+    return " ".join(p.text_content() for p in tree.iter("p"))